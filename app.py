@@ -345,7 +345,7 @@ def save_user_settings(settings):
     """Save user settings to file"""
     try:
         with open(Config.SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+            f.write(json.dumps(settings, indent=2))
         return True
     except Exception as e:
         logger.error(f"Error saving settings: {e}")
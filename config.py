@@ -7,6 +7,8 @@ Splunk Dashboard Automator application. It centralizes all configuration
 in one place for easy maintenance and modification.
 """
 
+import functools
+import re
 import pytz
 from datetime import datetime
 
@@ -21,6 +23,7 @@ class Config:
     
     File Names:
     - DASHBOARD_FILE: JSON file storing dashboard configurations
+    - DASHBOARD_DB_FILE: SQLite database storing dashboards when DASHBOARD_STORAGE is "sqlite"
     - SCHEDULE_FILE: JSON file storing schedule configurations  
     - SETTINGS_FILE: JSON file storing user settings
     - SECRETS_KEY_FILE: File containing encryption key
@@ -40,6 +43,7 @@ class Config:
     
     # Configuration file names
     DASHBOARD_FILE = "dashboards.json"
+    DASHBOARD_DB_FILE = "dashboards.db"
     SCHEDULE_FILE = "schedules.json"
     SETTINGS_FILE = "settings.json"
     SECRETS_KEY_FILE = ".secrets.key"
@@ -57,6 +61,11 @@ class Config:
     
     # Schedule settings
     SCHEDULE_CHECK_INTERVAL = 60  # Check schedules every 60 seconds
+    
+    # Dashboard storage settings
+    DASHBOARD_SAVE_DELAY = 0.25  # Seconds to coalesce changes before saving (0 saves immediately)
+    DASHBOARD_STORAGE = "json"  # "json" rewrites DASHBOARD_FILE, "sqlite" updates rows in DASHBOARD_DB_FILE
+    COMPRESS_DASHBOARD_FILE = False  # Store the JSON file zstd-compressed as DASHBOARD_FILE + ".zst"
 
 class Theme:
     """
@@ -216,25 +225,29 @@ def get_current_timestamp():
     """
     return datetime.now(Config.EST).strftime("%Y-%m-%d %H:%M:%S %Z")
 
+_URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=8192)
 def validate_url(url):
     """
     Basic URL validation.
     
+    Results are cached, since the same URLs are checked repeatedly on
+    updates and imports.
+    
     Args:
         url (str): URL to validate
         
     Returns:
         bool: True if URL appears valid, False otherwise
     """
-    import re
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    return url_pattern.match(url) is not None
+    return _URL_PATTERN.match(url) is not None
 
 def sanitize_filename(filename):
     """
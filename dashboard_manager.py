@@ -14,16 +14,133 @@ It provides:
 import json
 import os
 import logging
-import uuid
+import secrets
 import shutil
+import sqlite3
+import atexit
+import functools
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 from utils.config import Config, get_current_timestamp, validate_url, sanitize_filename
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library encoder
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # Import files are parsed in one go
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # The dashboard file is stored uncompressed
+
 logger = logging.getLogger(__name__)
 
+# Single worker that copies the backup off the caller's thread
+_io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dashboard-io')
+atexit.register(_io_pool.shutdown)
+
+# Bound once to skip the attribute lookup when generating many IDs
+_token_hex = secrets.token_hex
+
+# Frame header written at the start of every zstd-compressed file
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Error for import files whose 'dashboards' value is not an array
+_DASHBOARDS_NOT_LIST = "Invalid import file format: 'dashboards' must be a list"
+
+# Default values for dashboard fields missing from older files
+_DASHBOARD_DEFAULTS = {
+    'status': 'Ready',
+    'selected': False,
+    'lists': [],
+    'description': '',
+    'last_captured': None,
+    'capture_count': 0,
+    'metadata': {}
+}
+
+# Every field a dashboard must have after migration
+_DASHBOARD_FIELDS = frozenset(_DASHBOARD_DEFAULTS) | {'id', 'created_at', 'updated_at'}
+
+
+def _dump_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to JSON bytes, using orjson when it is installed.
+    
+    Args:
+        data (Any): Data to serialize
+        pretty (bool): If True, indent the output for human readers;
+            otherwise emit compact JSON
+        
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, default=str).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def _decompress(raw: bytes) -> bytes:
+    """
+    Decompress zstd data, passing uncompressed data through unchanged.
+    
+    Args:
+        raw (bytes): File contents
+        
+    Returns:
+        bytes: Uncompressed contents
+    """
+    if not raw.startswith(_ZSTD_MAGIC):
+        return raw
+    if zstandard is None:
+        raise RuntimeError("Dashboard file is zstd-compressed but zstandard is not installed")
+    return zstandard.ZstdDecompressor().decompress(raw)
+
+
+def _copy_backup(source: str, backup_file: str):
+    """
+    Copy a dashboard file to its backup location, logging any failure.
+    
+    Args:
+        source (str): Dashboard file about to be overwritten
+        backup_file (str): Backup file path
+    """
+    try:
+        shutil.copy2(source, backup_file)
+    except Exception as e:
+        logger.error(f"Error backing up dashboards: {e}")
+
+
+def _load_json(raw: bytes) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+    
+    Args:
+        raw (bytes): UTF-8 encoded JSON document
+        
+    Returns:
+        Any: Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class DashboardManager:
     """
     Manages dashboard and list operations for the Splunk Dashboard Automator.
@@ -41,9 +158,44 @@ class DashboardManager:
         self.dashboards = {}
         self.lists = set()
         
+        # Lookup indexes, rebuilt by load_dashboards()
+        # Each key maps to the ordered set of IDs holding it; older files
+        # may contain duplicates, so a key can have several holders
+        self._by_name_lower: Dict[str, Dict[str, None]] = {}
+        self._name_keys: Dict[str, str] = {}  # Dashboard ID -> lowercased name
+        self._by_url: Dict[str, Dict[str, None]] = {}
+        self._by_list: Dict[str, Dict[str, None]] = {}  # Ordered sets of IDs
+        self._list_refcount: Counter = Counter()
+        self._no_list_count = 0
+        self._search_blobs: Dict[str, str] = {}
+        
+        # Query result caches keyed on (query, data version); every change
+        # bumps the version so stale entries are never returned
+        self._data_version = 0
+        self._by_list_cached = functools.lru_cache(maxsize=256)(self._get_dashboards_by_list)
+        self._search_cached = functools.lru_cache(maxsize=256)(self._search_dashboards)
+        
+        # Deferred save state
+        self._dirty = False
+        self._changed_ids: Dict[str, None] = {}  # Ordered set of IDs to write
+        self._full_save = False
+        self._db = None
+        self._suspend_save = False
+        self._save_timer = None
+        self._save_lock = threading.RLock()
+        self._backup_created = False
+        
+        # Compressed storage needs the optional zstandard package
+        self._compress_file = Config.COMPRESS_DASHBOARD_FILE and zstandard is not None
+        if Config.COMPRESS_DASHBOARD_FILE and zstandard is None:
+            logger.warning("zstandard is not installed, saving dashboards uncompressed")
+        
         # Load existing data
         self.load_dashboards()
         
+        # Write any pending changes before the interpreter exits
+        atexit.register(self.flush)
+        
         logger.info("Dashboard manager initialized")
     
     def generate_id(self) -> str:
@@ -51,9 +203,9 @@ class DashboardManager:
         Generate a unique ID for a new dashboard.
         
         Returns:
-            str: Unique dashboard ID
+            str: Unique dashboard ID (32 random hex characters)
         """
-        return str(uuid.uuid4())
+        return _token_hex(16)
     
     def add_dashboard(self, dashboard_data: Dict[str, Any]) -> bool:
         """
@@ -72,35 +224,13 @@ class DashboardManager:
                 logger.error(f"Invalid dashboard data: {validation_result['error']}")
                 return False
             
-            # Generate ID if not provided
-            if 'id' not in dashboard_data:
-                dashboard_data['id'] = self.generate_id()
-            
-            # Sanitize and prepare dashboard object
-            dashboard = {
-                'id': dashboard_data['id'],
-                'name': dashboard_data['name'].strip(),
-                'url': dashboard_data['url'].strip(),
-                'lists': dashboard_data.get('lists', []),
-                'description': dashboard_data.get('description', '').strip(),
-                'selected': False,
-                'status': 'Ready',
-                'created_at': dashboard_data.get('created_at', get_current_timestamp()),
-                'updated_at': get_current_timestamp(),
-                'last_captured': None,
-                'capture_count': 0,
-                'metadata': dashboard_data.get('metadata', {})
-            }
-            
-            # Add lists to the global lists set
-            for list_name in dashboard['lists']:
-                self.lists.add(list_name)
+            dashboard = self._build_dashboard(
+                dashboard_data, validation_result['name'], validation_result['url']
+            )
+            self._insert_dashboard(dashboard)
             
-            # Add to dashboards dictionary
-            self.dashboards[dashboard['id']] = dashboard
-            
-            # Save to file
-            self.save_dashboards()
+            # Schedule save
+            self._mark_dirty([dashboard['id']])
             
             logger.info(f"Added dashboard: {dashboard['name']} (ID: {dashboard['id']})")
             return True
@@ -127,45 +257,73 @@ class DashboardManager:
             
             dashboard = self.dashboards[dashboard_id]
             
-            # Validate update data if name or URL are being changed
+            # Validate the changed fields before the dashboard is touched
+            fields = {}  # Stripped name and URL from _validate_fields()
+            validation_result = {'valid': True, 'error': None}
             if 'name' in update_data or 'url' in update_data:
-                temp_data = dashboard.copy()
-                temp_data.update(update_data)
-                validation_result = self._validate_dashboard(temp_data, dashboard_id)
-                if not validation_result['valid']:
-                    logger.error(f"Invalid update data: {validation_result['error']}")
-                    return False
+                validation_result = fields = self._validate_fields(
+                    update_data.get('name', dashboard['name']),
+                    update_data.get('url', dashboard['url']),
+                    exclude_id=dashboard_id
+                )
+            if validation_result['valid'] and 'lists' in update_data:
+                validation_result = self._validate_lists(update_data['lists'])
+            if not validation_result['valid']:
+                logger.error(f"Invalid update data: {validation_result['error']}")
+                return False
             
-            # Update fields
-            for key, value in update_data.items():
-                if key in ['id', 'created_at', 'capture_count']:
-                    continue  # Don't allow updating these fields
-                
-                if key == 'name' or key == 'description':
-                    dashboard[key] = value.strip() if isinstance(value, str) else value
-                elif key == 'url':
-                    dashboard[key] = value.strip() if isinstance(value, str) else value
-                elif key == 'lists':
-                    # Handle list updates
-                    old_lists = set(dashboard.get('lists', []))
-                    new_lists = set(value if isinstance(value, list) else [])
+            # Update fields, re-indexing only what changes so the dashboard
+            # keeps its position in the indexes it stays in
+            old_lists = set(dashboard.get('lists', []))
+            removed_lists = set()
+            if 'name' in update_data:
+                self._unindex_name(dashboard_id)
+            if 'url' in update_data:
+                self._unindex_url(dashboard_id, dashboard)
+            try:
+                for key, value in update_data.items():
+                    if key in ['id', 'created_at', 'capture_count']:
+                        continue  # Don't allow updating these fields
                     
-                    dashboard[key] = list(new_lists)
-                    
-                    # Update global lists set
-                    for list_name in new_lists:
-                        self.lists.add(list_name)
-                    
-                    # Remove unused lists (if no other dashboards use them)
-                    self._cleanup_unused_lists()
-                else:
-                    dashboard[key] = value
+                    if key == 'name' or key == 'url':
+                        dashboard[key] = fields[key]
+                    elif key == 'description':
+                        dashboard[key] = value.strip() if isinstance(value, str) else value
+                    elif key == 'lists':
+                        # Handle list updates
+                        new_lists = set(value if isinstance(value, list) else [])
+                        
+                        dashboard[key] = list(new_lists)
+                        
+                        # Update global lists set
+                        for list_name in new_lists:
+                            self.lists.add(list_name)
+                    else:
+                        dashboard[key] = value
+            finally:
+                if 'name' in update_data:
+                    self._index_name(dashboard_id, dashboard)
+                if 'url' in update_data:
+                    self._index_url(dashboard_id, dashboard)
+                if 'lists' in update_data:
+                    new_lists = set(dashboard.get('lists', []))
+                    removed_lists = old_lists - new_lists
+                    self._unindex_lists(dashboard_id, removed_lists)
+                    self._index_lists(dashboard_id, new_lists - old_lists)
+                    if old_lists and not new_lists:
+                        self._no_list_count += 1
+                    elif new_lists and not old_lists:
+                        self._no_list_count -= 1
+                self._search_blobs[dashboard_id] = self._build_search_blob(dashboard)
+            
+            # Remove dropped lists if no other dashboards use them
+            self._cleanup_unused_lists(removed_lists)
             
             # Update timestamp
             dashboard['updated_at'] = get_current_timestamp()
             
-            # Save to file
-            self.save_dashboards()
+            # Schedule save
+            self._mark_dirty([dashboard_id])
             
             logger.info(f"Updated dashboard: {dashboard['name']} (ID: {dashboard_id})")
             return True
@@ -201,22 +359,26 @@ class DashboardManager:
                 logger.error("No dashboard IDs provided for deletion")
                 return False
             
+            deleted_ids = []
             deleted_names = []
+            touched_lists = set()
             
             for dashboard_id in dashboard_ids:
                 if dashboard_id in self.dashboards:
-                    dashboard_name = self.dashboards[dashboard_id]['name']
-                    del self.dashboards[dashboard_id]
-                    deleted_names.append(dashboard_name)
+                    dashboard = self.dashboards.pop(dashboard_id)
+                    self._unindex_dashboard(dashboard_id, dashboard)
+                    touched_lists.update(dashboard.get('lists', []))
+                    deleted_ids.append(dashboard_id)
+                    deleted_names.append(dashboard['name'])
                 else:
                     logger.warning(f"Dashboard not found for deletion: {dashboard_id}")
             
             if deleted_names:
-                # Clean up unused lists
-                self._cleanup_unused_lists()
+                # Clean up lists left without dashboards
+                self._cleanup_unused_lists(touched_lists)
                 
-                # Save to file
-                self.save_dashboards()
+                # Schedule save
+                self._mark_dirty(deleted_ids)
                 
                 logger.info(f"Deleted dashboards: {', '.join(deleted_names)}")
                 return True
@@ -279,14 +441,18 @@ class DashboardManager:
         Returns:
             List[Dict[str, Any]]: List of dashboards in the specified list
         """
-        return [
-            dashboard for dashboard in self.dashboards.values()
-            if list_name in dashboard.get('lists', [])
-        ]
+        return list(self._by_list_cached(list_name, self._data_version))
+    
+    def _get_dashboards_by_list(self, list_name: str, data_version: int) -> Tuple[Dict[str, Any], ...]:
+        """Uncached implementation of get_dashboards_by_list()."""
+        return tuple(self.dashboards[dashboard_id] for dashboard_id in self._by_list.get(list_name, ()))
     
     def search_dashboards(self, query: str) -> List[Dict[str, Any]]:
         """
-        Search dashboards by name, URL, or description.
+        Search dashboards by name, URL, description, or list.
+        
+        Queries with several words match dashboards containing all of them,
+        each word in any of the searched fields.
         
         Args:
             query (str): Search query
@@ -294,35 +460,30 @@ class DashboardManager:
         Returns:
             List[Dict[str, Any]]: List of matching dashboards
         """
+        return list(self._search_cached(query, self._data_version))
+    
+    def _search_dashboards(self, query: str, data_version: int) -> Tuple[Dict[str, Any], ...]:
+        """Uncached implementation of search_dashboards()."""
         query_lower = query.lower().strip()
         if not query_lower:
-            return self.get_all_dashboards()
+            return tuple(self.dashboards.values())
         
-        matching_dashboards = []
+        # Each blob holds the lowercased name, URL, description and lists
+        search_blobs = self._search_blobs
+        terms = query_lower.split()
+        if len(terms) == 1:
+            return tuple(
+                dashboard for dashboard_id, dashboard in self.dashboards.items()
+                if query_lower in search_blobs.get(dashboard_id, '')
+            )
         
-        for dashboard in self.dashboards.values():
-            # Search in name
-            if query_lower in dashboard.get('name', '').lower():
-                matching_dashboards.append(dashboard)
-                continue
-            
-            # Search in URL
-            if query_lower in dashboard.get('url', '').lower():
-                matching_dashboards.append(dashboard)
-                continue
-            
-            # Search in description
-            if query_lower in dashboard.get('description', '').lower():
-                matching_dashboards.append(dashboard)
-                continue
-            
-            # Search in lists
-            for list_name in dashboard.get('lists', []):
-                if query_lower in list_name.lower():
-                    matching_dashboards.append(dashboard)
-                    break
-        
-        return matching_dashboards
+        terms = list(dict.fromkeys(terms))
+        matches = []
+        for dashboard_id, dashboard in self.dashboards.items():
+            blob = search_blobs.get(dashboard_id, '')
+            if all(term in blob for term in terms):
+                matches.append(dashboard)
+        return tuple(matches)
     
     def add_list(self, list_name: str) -> bool:
         """
@@ -345,7 +506,7 @@ class DashboardManager:
             return False
         
         self.lists.add(list_name)
-        self.save_dashboards()  # Lists are saved with dashboards
+        self._mark_dirty()  # Lists are saved with dashboards
         
         logger.info(f"Added list: {list_name}")
         return True
@@ -377,20 +538,31 @@ class DashboardManager:
                 logger.error(f"List already exists: {new_name}")
                 return False
             
-            # Update all dashboards that use this list
-            for dashboard in self.dashboards.values():
-                lists = dashboard.get('lists', [])
-                if old_name in lists:
-                    # Replace old name with new name
-                    dashboard['lists'] = [new_name if l == old_name else l for l in lists]
-                    dashboard['updated_at'] = get_current_timestamp()
-            
-            # Update lists set
+            # Update only the dashboards that use this list
+            now = get_current_timestamp()
+            dashboard_ids = self._by_list.get(old_name, {})
+            for dashboard_id in dashboard_ids:
+                dashboard = self.dashboards[dashboard_id]
+                lists = dashboard['lists']
+                # Replace old name with new name in place
+                for index, list_name in enumerate(lists):
+                    if list_name == old_name:
+                        lists[index] = new_name
+                dashboard['updated_at'] = now
+                self._search_blobs[dashboard_id] = self._build_search_blob(dashboard)
+            
+            # Update lists set and index
             self.lists.remove(old_name)
             self.lists.add(new_name)
+            self._by_list.pop(old_name, None)
+            if dashboard_ids:
+                self._by_list.setdefault(new_name, {}).update(dashboard_ids)
+            usage_count = self._list_refcount.pop(old_name, 0)
+            if usage_count:
+                self._list_refcount[new_name] += usage_count
             
-            # Save changes
-            self.save_dashboards()
+            # Schedule save
+            self._mark_dirty(dashboard_ids)
             
             logger.info(f"Renamed list: {old_name} -> {new_name}")
             return True
@@ -420,18 +592,26 @@ class DashboardManager:
                 logger.error(f"List not found: {list_name}")
                 return False
             
-            # Remove from all dashboards
-            for dashboard in self.dashboards.values():
-                lists = dashboard.get('lists', [])
-                if list_name in lists:
-                    dashboard['lists'] = [l for l in lists if l != list_name]
-                    dashboard['updated_at'] = get_current_timestamp()
-            
-            # Remove from lists set
+            # Remove only from the dashboards that use this list
+            now = get_current_timestamp()
+            dashboard_ids = self._by_list.get(list_name, {})
+            for dashboard_id in dashboard_ids:
+                dashboard = self.dashboards[dashboard_id]
+                lists = dashboard['lists']
+                while list_name in lists:
+                    lists.remove(list_name)
+                dashboard['updated_at'] = now
+                self._search_blobs[dashboard_id] = self._build_search_blob(dashboard)
+                if not lists:
+                    self._no_list_count += 1
+            
+            # Remove from lists set and index
             self.lists.remove(list_name)
+            self._by_list.pop(list_name, None)
+            self._list_refcount.pop(list_name, None)
             
-            # Save changes
-            self.save_dashboards()
+            # Schedule save
+            self._mark_dirty(dashboard_ids)
             
             logger.info(f"Deleted list: {list_name}")
             return True
@@ -465,24 +645,12 @@ class DashboardManager:
             'least_used_list': None
         }
         
-        # Count dashboard usage per list
-        list_counts = {}
-        for list_name in self.lists:
-            list_counts[list_name] = 0
-        
-        dashboards_without_lists = 0
-        
-        for dashboard in self.dashboards.values():
-            dashboard_lists = dashboard.get('lists', [])
-            if not dashboard_lists:
-                dashboards_without_lists += 1
-            else:
-                for list_name in dashboard_lists:
-                    if list_name in list_counts:
-                        list_counts[list_name] += 1
+        # Dashboard usage per list comes from the reference counter
+        list_refcount = self._list_refcount
+        list_counts = {list_name: list_refcount.get(list_name, 0) for list_name in self.lists}
         
         stats['list_usage'] = list_counts
-        stats['dashboards_without_lists'] = dashboards_without_lists
+        stats['dashboards_without_lists'] = self._no_list_count
         
         # Find most and least used lists
         if list_counts:
@@ -523,8 +691,8 @@ class DashboardManager:
                 'lists': list(self.lists)
             }
             
-            with open(file_path, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            with open(file_path, 'wb') as f:
+                f.write(_dump_json(export_data, pretty=True))
             
             logger.info(f"Exported {len(self.dashboards)} dashboards to {file_path}")
             return file_path
@@ -545,14 +713,24 @@ class DashboardManager:
             Dict[str, Any]: Import results
         """
         try:
-            with open(file_path, 'r') as f:
-                import_data = json.load(f)
-            
-            if 'dashboards' not in import_data:
-                raise ValueError("Invalid import file format: missing 'dashboards' key")
-            
-            imported_dashboards = import_data['dashboards']
-            imported_lists = import_data.get('lists', [])
+            if ijson is not None:
+                # Stream the file so large imports are never fully materialized
+                has_dashboards, imported_lists = self._scan_import_file(file_path)
+                if not has_dashboards:
+                    raise ValueError("Invalid import file format: missing 'dashboards' key")
+                
+                imported_dashboards = self._iter_import_dashboards(file_path)
+            else:
+                with open(file_path, 'rb') as f:
+                    import_data = _load_json(f.read())
+                
+                if 'dashboards' not in import_data:
+                    raise ValueError("Invalid import file format: missing 'dashboards' key")
+                if not isinstance(import_data['dashboards'], list):
+                    raise ValueError(_DASHBOARDS_NOT_LIST)
+                
+                imported_dashboards = import_data['dashboards']
+                imported_lists = import_data.get('lists', [])
             
             results = {
                 'success': True,
@@ -563,39 +741,38 @@ class DashboardManager:
                 'errors': []
             }
             
-            if not merge:
-                # Replace mode: clear existing data
-                self.dashboards = {}
-                self.lists = set()
-            
-            # Import lists first
-            for list_name in imported_lists:
-                if list_name not in self.lists:
-                    self.lists.add(list_name)
-                    results['imported_lists'] += 1
-            
-            # Import dashboards
-            for dashboard_data in imported_dashboards:
-                try:
-                    dashboard_id = dashboard_data.get('id')
-                    
-                    if merge and dashboard_id in self.dashboards:
-                        # Update existing dashboard
-                        if self.update_dashboard(dashboard_id, dashboard_data):
-                            results['updated_dashboards'] += 1
-                        else:
-                            results['skipped_dashboards'] += 1
-                    else:
-                        # Add new dashboard
-                        if self.add_dashboard(dashboard_data):
-                            results['imported_dashboards'] += 1
-                        else:
-                            results['skipped_dashboards'] += 1
-                            
-                except Exception as e:
-                    error_msg = f"Error importing dashboard {dashboard_data.get('name', 'Unknown')}: {e}"
-                    results['errors'].append(error_msg)
-                    logger.error(error_msg)
+            # Defer saving until the whole import has been applied; a save
+            # already scheduled must not write the half-imported data
+            with self._save_lock:
+                self._suspend_save = True
+                self._cancel_save_timer()
+            try:
+                if not merge:
+                    # Replace mode: clear existing data
+                    self.dashboards = {}
+                    self.lists = set()
+                    self._rebuild_indexes()
+                    self._full_save = True
+                    self._mark_dirty()
+                
+                # Import lists first
+                for list_name in imported_lists:
+                    if list_name not in self.lists:
+                        self.lists.add(list_name)
+                        results['imported_lists'] += 1
+                        self._mark_dirty()
+                
+                # Import dashboards
+                bulk_results = self._bulk_add(imported_dashboards, merge=merge)
+                results['imported_dashboards'] = bulk_results['added']
+                results['updated_dashboards'] = bulk_results['updated']
+                results['skipped_dashboards'] = bulk_results['skipped']
+                results['errors'].extend(bulk_results['errors'])
+            finally:
+                # Write the imported data once
+                self._suspend_save = False
+                self.flush()
+                self._clear_query_caches()
             
             logger.info(f"Import completed: {results['imported_dashboards']} new, "
                        f"{results['updated_dashboards']} updated, "
@@ -615,45 +792,308 @@ class DashboardManager:
                 'errors': [str(e)]
             }
     
-    def save_dashboards(self):
-        """Save all dashboards and lists to the configuration file."""
-        try:
-            # Create backup of existing file
-            if os.path.exists(Config.DASHBOARD_FILE):
-                backup_file = f"{Config.DASHBOARD_FILE}.backup"
-                shutil.copy2(Config.DASHBOARD_FILE, backup_file)
-            
-            # Prepare data for saving
-            save_data = {
-                'dashboards': self.dashboards,
-                'lists': list(self.lists),
-                'last_updated': get_current_timestamp(),
-                'version': '1.0'
-            }
+    def _scan_import_file(self, file_path: str) -> Tuple[bool, List[str]]:
+        """
+        Check an import file and collect its lists without building the dashboards.
+        
+        The whole file is parsed, so malformed JSON is rejected before any
+        existing data is modified.
+        
+        Args:
+            file_path (str): Path to the import file
             
-            # Save to file
-            with open(Config.DASHBOARD_FILE, 'w') as f:
-                json.dump(save_data, f, indent=2, default=str)
+        Returns:
+            Tuple[bool, List[str]]: Whether a 'dashboards' key exists, and the list names
             
-            logger.debug("Dashboards and lists saved to file")
+        Raises:
+            ValueError: If the 'dashboards' value is not a list
+        """
+        has_dashboards = False
+        lists = []
+        
+        with open(file_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == '' and event == 'map_key' and value == 'dashboards':
+                    has_dashboards = True
+                elif prefix == 'dashboards' and event not in ('start_array', 'end_array'):
+                    raise ValueError(_DASHBOARDS_NOT_LIST)
+                elif prefix == 'lists.item' and event == 'string':
+                    lists.append(value)
+        
+        return has_dashboards, lists
+    
+    def _iter_import_dashboards(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the dashboards of an import file one at a time.
+        
+        Args:
+            file_path (str): Path to the import file
             
-        except Exception as e:
-            logger.error(f"Error saving dashboards: {e}")
-            # Try to restore from backup
-            backup_file = f"{Config.DASHBOARD_FILE}.backup"
-            if os.path.exists(backup_file):
+        Yields:
+            Dict[str, Any]: Dashboard configuration
+        """
+        with open(file_path, 'rb') as f:
+            yield from ijson.items(f, 'dashboards.item', use_float=True)
+    
+    def _bulk_add(self, dashboards_data: Iterable[Dict[str, Any]], merge: bool = False) -> Dict[str, Any]:
+        """
+        Add many dashboards at once with a single save.
+        
+        Each dashboard is validated against the lookup indexes, which already
+        include the dashboards added earlier in the same batch.
+        
+        Args:
+            dashboards_data (Iterable[Dict[str, Any]]): Dashboard configurations
+            merge (bool): If True, dashboards whose ID already exists are updated
+            
+        Returns:
+            Dict[str, Any]: Counts of added, updated and skipped dashboards plus errors
+        """
+        results = {'added': 0, 'updated': 0, 'skipped': 0, 'errors': []}
+        added_ids = []
+        now = get_current_timestamp()
+        
+        for dashboard_data in dashboards_data:
+            try:
+                dashboard_id = dashboard_data.get('id')
+                
+                if merge and dashboard_id in self.dashboards:
+                    # Update existing dashboard
+                    if self.update_dashboard(dashboard_id, dashboard_data):
+                        results['updated'] += 1
+                    else:
+                        results['skipped'] += 1
+                    continue
+                
+                validation_result = self._validate_dashboard(dashboard_data)
+                if not validation_result['valid']:
+                    logger.error(f"Invalid dashboard data: {validation_result['error']}")
+                    results['skipped'] += 1
+                    continue
+                
+                dashboard = self._build_dashboard(
+                    dashboard_data, validation_result['name'], validation_result['url'], now
+                )
+                self._insert_dashboard(dashboard)
+                added_ids.append(dashboard['id'])
+                results['added'] += 1
+                
+            except Exception as e:
+                error_msg = f"Error importing dashboard {dashboard_data.get('name', 'Unknown')}: {e}"
+                results['errors'].append(error_msg)
+                logger.error(error_msg)
+        
+        if added_ids:
+            self._mark_dirty(added_ids)
+        
+        logger.info(f"Bulk added {results['added']} dashboards")
+        return results
+    
+    def flush(self):
+        """
+        Write pending changes to the configuration file immediately.
+        
+        Does nothing while saves are suspended by a bulk operation, which
+        flushes itself once it is complete.
+        """
+        with self._save_lock:
+            self._cancel_save_timer()
+            if self._dirty and not self._suspend_save:
+                self.save_dashboards()
+    
+    def _cancel_save_timer(self):
+        """Cancel the scheduled deferred save, if any."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+    
+    def save_dashboards(self):
+        """Save all dashboards and lists to the configured store."""
+        with self._save_lock:
+            # Never persist the partial state of a bulk operation
+            if self._suspend_save:
+                return
+            
+            # Changes made while writing will mark the data dirty again
+            changed_ids, self._changed_ids = self._changed_ids, {}
+            full_save, self._full_save = self._full_save, False
+            self._dirty = False
+            try:
+                if Config.DASHBOARD_STORAGE == 'sqlite':
+                    self._save_to_database(changed_ids, full_save)
+                else:
+                    self._save_to_file()
+                
+                logger.debug("Dashboards and lists saved")
+                
+            except Exception as e:
+                self._dirty = True
+                self._changed_ids = {**changed_ids, **self._changed_ids}
+                self._full_save = self._full_save or full_save
+                logger.error(f"Error saving dashboards: {e}")
+    
+    def _save_to_file(self):
+        """Write all dashboards and lists to the JSON configuration file."""
+        dashboard_file = self._dashboard_file_paths()[0]
+        
+        # Back up the file as it was before this process first saved; the
+        # copy runs while the new contents are encoded and written
+        backup_future = None
+        if not self._backup_created:
+            if os.path.exists(dashboard_file):
+                backup_future = self._start_backup(dashboard_file)
+            self._backup_created = True
+        
+        # Prepare data for saving
+        save_data = {
+            'dashboards': self.dashboards,
+            'lists': list(self.lists),
+            'last_updated': get_current_timestamp(),
+            'version': '1.0'
+        }
+        
+        # Write to a temporary file and atomically replace the original,
+        # so an interrupted save never leaves a truncated file behind
+        data = _dump_json(save_data)
+        if self._compress_file:
+            data = zstandard.ZstdCompressor(level=3).compress(data)
+        
+        tmp_file = f"{dashboard_file}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            if backup_future is not None:
+                backup_future.result()
+            os.replace(tmp_file, dashboard_file)
+        except Exception:
+            # The original file is untouched; discard the partial write
+            if os.path.exists(tmp_file):
                 try:
-                    shutil.copy2(backup_file, Config.DASHBOARD_FILE)
-                    logger.info("Restored dashboards from backup after save error")
-                except Exception as restore_error:
-                    logger.error(f"Failed to restore from backup: {restore_error}")
+                    os.remove(tmp_file)
+                except OSError as cleanup_error:
+                    logger.error(f"Failed to remove temporary file: {cleanup_error}")
+            raise
+    
+    def _start_backup(self, dashboard_file: str) -> Optional[Future]:
+        """
+        Copy the dashboard file to its .backup in the background.
+        
+        Args:
+            dashboard_file (str): Dashboard file about to be overwritten
+            
+        Returns:
+            Optional[Future]: Pending copy, or None if it already ran
+        """
+        backup_file = f"{dashboard_file}.backup"
+        try:
+            return _io_pool.submit(_copy_backup, dashboard_file, backup_file)
+        except RuntimeError:
+            # The pool no longer accepts work during interpreter shutdown
+            _copy_backup(dashboard_file, backup_file)
+            return None
+    
+    def _dashboard_file_paths(self) -> List[str]:
+        """
+        Get the plain and compressed dashboard file paths.
+        
+        Returns:
+            List[str]: File paths, the one written by save_dashboards() first
+        """
+        compressed_file = f"{Config.DASHBOARD_FILE}.zst"
+        if self._compress_file:
+            return [compressed_file, Config.DASHBOARD_FILE]
+        return [Config.DASHBOARD_FILE, compressed_file]
+    
+    def _get_database(self) -> sqlite3.Connection:
+        """
+        Open the SQLite dashboard store, creating its tables on first use.
+        
+        Returns:
+            sqlite3.Connection: Connection in autocommit mode
+        """
+        if self._db is None:
+            db = sqlite3.connect(Config.DASHBOARD_DB_FILE, isolation_level=None,
+                                 check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS dashboards ('
+                'id TEXT PRIMARY KEY, name TEXT, url TEXT, data BLOB)'
+            )
+            db.execute('CREATE TABLE IF NOT EXISTS lists (name TEXT PRIMARY KEY)')
+            self._db = db
+        return self._db
+    
+    def _save_to_database(self, changed_ids: Iterable[str], full_save: bool):
+        """
+        Write changed dashboards and all lists to the SQLite store.
+        
+        Args:
+            changed_ids (Iterable[str]): IDs of dashboards added, changed or deleted since the last save
+            full_save (bool): If True, replace every stored dashboard
+        """
+        db = self._get_database()
+        
+        if full_save:
+            changed_ids = list(self.dashboards)
+        
+        upserts = []
+        deletes = []
+        for dashboard_id in changed_ids:
+            dashboard = self.dashboards.get(dashboard_id)
+            if dashboard is None:
+                deletes.append((dashboard_id,))
+            else:
+                upserts.append((dashboard_id, dashboard.get('name', ''),
+                                dashboard.get('url', ''), _dump_json(dashboard)))
+        
+        db.execute('BEGIN')
+        try:
+            if full_save:
+                db.execute('DELETE FROM dashboards')
+            db.executemany('DELETE FROM dashboards WHERE id = ?', deletes)
+            db.executemany(
+                'INSERT INTO dashboards (id, name, url, data) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(id) DO UPDATE SET '
+                'name = excluded.name, url = excluded.url, data = excluded.data',
+                upserts
+            )
+            db.execute('DELETE FROM lists')
+            db.executemany('INSERT INTO lists (name) VALUES (?)',
+                           [(list_name,) for list_name in self.lists])
+            db.execute('COMMIT')
+        except Exception:
+            db.execute('ROLLBACK')
+            raise
+    
+    def _load_from_database(self):
+        """Load dashboards and lists from the SQLite store."""
+        db = self._get_database()
+        self.dashboards = {
+            dashboard_id: _load_json(data)
+            for dashboard_id, data in db.execute('SELECT id, data FROM dashboards ORDER BY rowid')
+        }
+        self.lists = {name for (name,) in db.execute('SELECT name FROM lists')}
     
     def load_dashboards(self):
-        """Load dashboards and lists from the configuration file."""
+        """Load dashboards and lists from the configured store."""
+        use_database = Config.DASHBOARD_STORAGE == 'sqlite'
+        # If both formats exist (compression was toggled), use the newest one
+        existing_files = [path for path in self._dashboard_file_paths() if os.path.exists(path)]
+        dashboard_file = max(existing_files, key=os.path.getmtime) if existing_files else None
         try:
-            if os.path.exists(Config.DASHBOARD_FILE):
-                with open(Config.DASHBOARD_FILE, 'r') as f:
-                    data = json.load(f)
+            if use_database and os.path.exists(Config.DASHBOARD_DB_FILE):
+                self._load_from_database()
+                
+                # Ensure all dashboards have required fields
+                self._migrate_dashboard_format()
+                
+                logger.info(f"Loaded {len(self.dashboards)} dashboards and {len(self.lists)} lists from database")
+            elif dashboard_file is not None:
+                with open(dashboard_file, 'rb') as f:
+                    data = _load_json(_decompress(f.read()))
                 
                 # Handle different file formats for backward compatibility
                 if isinstance(data, dict) and 'dashboards' in data:
@@ -678,6 +1118,10 @@ class DashboardManager:
                 self._migrate_dashboard_format()
                 
                 logger.info(f"Loaded {len(self.dashboards)} dashboards and {len(self.lists)} lists from file")
+                
+                # Copy the JSON data into the database on the next save
+                if use_database:
+                    self._full_save = True
             else:
                 self.dashboards = {}
                 self.lists = set()
@@ -687,33 +1131,30 @@ class DashboardManager:
             logger.error(f"Error loading dashboards: {e}")
             self.dashboards = {}
             self.lists = set()
+        
+        self._rebuild_indexes()
+        self._clear_query_caches()
+        
+        if self._full_save:
+            self._mark_dirty()
     
     def _migrate_dashboard_format(self):
         """Ensure all dashboards have the required fields for current version."""
         current_time = get_current_timestamp()
         
         for dashboard_id, dashboard in self.dashboards.items():
+            # Dashboards saved by the current version already have every field
+            if _DASHBOARD_FIELDS <= dashboard.keys():
+                continue
+            
             # Add missing fields with default values
-            if 'id' not in dashboard:
-                dashboard['id'] = dashboard_id
-            if 'created_at' not in dashboard:
-                dashboard['created_at'] = current_time
-            if 'updated_at' not in dashboard:
-                dashboard['updated_at'] = current_time
-            if 'status' not in dashboard:
-                dashboard['status'] = 'Ready'
-            if 'selected' not in dashboard:
-                dashboard['selected'] = False
-            if 'lists' not in dashboard:
-                dashboard['lists'] = []
-            if 'description' not in dashboard:
-                dashboard['description'] = ''
-            if 'last_captured' not in dashboard:
-                dashboard['last_captured'] = None
-            if 'capture_count' not in dashboard:
-                dashboard['capture_count'] = 0
-            if 'metadata' not in dashboard:
-                dashboard['metadata'] = {}
+            for key, value in _DASHBOARD_DEFAULTS.items():
+                if key not in dashboard:
+                    dashboard[key] = value.copy() if isinstance(value, (list, dict)) else value
+            
+            dashboard.setdefault('id', dashboard_id)
+            dashboard.setdefault('created_at', current_time)
+            dashboard.setdefault('updated_at', current_time)
     
     def _validate_dashboard(self, dashboard_data: Dict[str, Any], exclude_id: str = None) -> Dict[str, Any]:
         """
@@ -724,59 +1165,336 @@ class DashboardManager:
             exclude_id (str, optional): Dashboard ID to exclude from duplicate checks
             
         Returns:
-            Dict[str, Any]: Validation result with 'valid' boolean and 'error' message
+            Dict[str, Any]: Validation result as returned by _validate_fields()
+        """
+        # Required fields
+        if 'name' not in dashboard_data:
+            return {'valid': False, 'error': 'Dashboard name is required'}
+        
+        if 'url' not in dashboard_data:
+            return {'valid': False, 'error': 'Dashboard URL is required'}
+        
+        validation_result = self._validate_fields(dashboard_data['name'], dashboard_data['url'], exclude_id)
+        if not validation_result['valid']:
+            return validation_result
+        
+        # Validate lists if provided
+        if 'lists' in dashboard_data:
+            lists_result = self._validate_lists(dashboard_data['lists'])
+            if not lists_result['valid']:
+                return lists_result
+        
+        return validation_result
+    
+    def _validate_fields(self, name: str, url: str, exclude_id: str = None) -> Dict[str, Any]:
+        """
+        Validate a dashboard name and URL, including duplicate checks.
+        
+        Args:
+            name (str): Dashboard name
+            url (str): Dashboard URL
+            exclude_id (str, optional): Dashboard ID to exclude from duplicate checks
+            
+        Returns:
+            Dict[str, Any]: Validation result with 'valid' boolean and 'error' message,
+                plus the stripped 'name' and 'url' when valid
         """
         try:
-            # Required fields
-            if 'name' not in dashboard_data or not dashboard_data['name'].strip():
+            name = name.strip()
+            url = url.strip()
+            
+            if not name:
                 return {'valid': False, 'error': 'Dashboard name is required'}
             
-            if 'url' not in dashboard_data or not dashboard_data['url'].strip():
+            if not url:
                 return {'valid': False, 'error': 'Dashboard URL is required'}
             
             # Validate URL format
-            url = dashboard_data['url'].strip()
             if not validate_url(url):
                 return {'valid': False, 'error': 'Invalid URL format'}
             
             # Check for duplicate names
-            name = dashboard_data['name'].strip()
-            for dashboard_id, dashboard in self.dashboards.items():
-                if dashboard_id != exclude_id and dashboard['name'].lower() == name.lower():
-                    return {'valid': False, 'error': f'Dashboard name "{name}" already exists'}
+            if self._has_other_holder(self._by_name_lower, name.lower(), exclude_id):
+                return {'valid': False, 'error': f'Dashboard name "{name}" already exists'}
             
             # Check for duplicate URLs
-            for dashboard_id, dashboard in self.dashboards.items():
-                if dashboard_id != exclude_id and dashboard['url'] == url:
-                    return {'valid': False, 'error': f'Dashboard URL "{url}" already exists'}
-            
-            # Validate lists if provided
-            if 'lists' in dashboard_data:
-                lists = dashboard_data['lists']
-                if not isinstance(lists, list):
-                    return {'valid': False, 'error': 'Lists must be a list of strings'}
-                
-                for list_name in lists:
-                    if not isinstance(list_name, str) or not list_name.strip():
-                        return {'valid': False, 'error': 'All list names must be non-empty strings'}
+            if self._has_other_holder(self._by_url, url, exclude_id):
+                return {'valid': False, 'error': f'Dashboard URL "{url}" already exists'}
             
-            return {'valid': True, 'error': None}
+            return {'valid': True, 'error': None, 'name': name, 'url': url}
             
         except Exception as e:
             return {'valid': False, 'error': f'Validation error: {str(e)}'}
     
-    def _cleanup_unused_lists(self):
-        """Remove lists that are not used by any dashboard."""
-        used_lists = set()
-        for dashboard in self.dashboards.values():
-            for list_name in dashboard.get('lists', []):
-                used_lists.add(list_name)
+    def _validate_lists(self, lists: Any) -> Dict[str, Any]:
+        """
+        Validate the lists assigned to a dashboard.
         
-        # Remove unused lists
-        unused_lists = self.lists - used_lists
-        for unused_list in unused_lists:
-            self.lists.remove(unused_list)
-            logger.debug(f"Removed unused list: {unused_list}")
+        Args:
+            lists (Any): Value provided for the dashboard's lists
+            
+        Returns:
+            Dict[str, Any]: Validation result with 'valid' boolean and 'error' message
+        """
+        if not isinstance(lists, list):
+            return {'valid': False, 'error': 'Lists must be a list of strings'}
+        
+        for list_name in lists:
+            if not isinstance(list_name, str) or not list_name.strip():
+                return {'valid': False, 'error': 'All list names must be non-empty strings'}
+        
+        return {'valid': True, 'error': None}
+    
+    def _mark_dirty(self, dashboard_ids: Iterable[str] = ()):
+        """
+        Record that in-memory data changed and schedule a save.
+        
+        Saves are deferred by Config.DASHBOARD_SAVE_DELAY seconds so that a
+        burst of changes is written to disk once. While saves are suspended
+        (during bulk operations) only the dirty flag is set; call flush() to
+        write immediately.
+        
+        Args:
+            dashboard_ids (Iterable[str]): IDs of dashboards that were added,
+                changed or deleted (used by the SQLite store to write only those rows)
+        """
+        with self._save_lock:
+            self._dirty = True
+            self._changed_ids.update(dict.fromkeys(dashboard_ids))
+            self._data_version += 1
+            if self._suspend_save or self._save_timer is not None:
+                return
+            
+            if Config.DASHBOARD_SAVE_DELAY <= 0:
+                self.save_dashboards()
+                return
+            
+            self._save_timer = threading.Timer(Config.DASHBOARD_SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _build_dashboard(self, dashboard_data: Dict[str, Any], name: str, url: str,
+                         timestamp: str = None) -> Dict[str, Any]:
+        """
+        Build a sanitized dashboard object from validated input data.
+        
+        Args:
+            dashboard_data (Dict[str, Any]): Dashboard configuration
+            name (str): Stripped name returned by _validate_fields()
+            url (str): Stripped URL returned by _validate_fields()
+            timestamp (str, optional): Creation/update timestamp to use; defaults to now
+            
+        Returns:
+            Dict[str, Any]: Dashboard object ready to be stored
+        """
+        if timestamp is None:
+            timestamp = get_current_timestamp()
+        
+        # Generate ID if not provided
+        if 'id' not in dashboard_data:
+            dashboard_data['id'] = self.generate_id()
+        
+        # Own copies, since lists are edited in place; other values are kept as given
+        lists = dashboard_data.get('lists', [])
+        metadata = dashboard_data.get('metadata', {})
+        
+        return {
+            'id': dashboard_data['id'],
+            'name': name,
+            'url': url,
+            'lists': list(lists) if isinstance(lists, list) else lists,
+            'description': dashboard_data.get('description', '').strip(),
+            'selected': False,
+            'status': 'Ready',
+            'created_at': dashboard_data.get('created_at', timestamp),
+            'updated_at': timestamp,
+            'last_captured': None,
+            'capture_count': 0,
+            'metadata': dict(metadata) if isinstance(metadata, dict) else metadata
+        }
+    
+    def _insert_dashboard(self, dashboard: Dict[str, Any]):
+        """
+        Store a dashboard and register it in the lists set and lookup indexes.
+        
+        Args:
+            dashboard (Dict[str, Any]): Dashboard object from _build_dashboard()
+        """
+        # Add lists to the global lists set
+        for list_name in dashboard['lists']:
+            self.lists.add(list_name)
+        
+        # Add to dashboards dictionary, replacing any dashboard with the same ID
+        existing = self.dashboards.get(dashboard['id'])
+        if existing is not None:
+            self._unindex_dashboard(dashboard['id'], existing)
+        self.dashboards[dashboard['id']] = dashboard
+        self._index_dashboard(dashboard['id'], dashboard)
+    
+    def _clear_query_caches(self):
+        """Drop all cached list and search results."""
+        self._data_version += 1
+        self._by_list_cached.cache_clear()
+        self._search_cached.cache_clear()
+    
+    def _rebuild_indexes(self):
+        """Rebuild the lookup indexes and list usage counts from the dashboards."""
+        self._by_name_lower = {}
+        self._name_keys = {}
+        self._by_url = {}
+        self._by_list = {}
+        self._list_refcount = Counter()
+        self._no_list_count = 0
+        self._search_blobs = {}
+        
+        for dashboard_id, dashboard in self.dashboards.items():
+            self._index_dashboard(dashboard_id, dashboard)
+    
+    def _index_dashboard(self, dashboard_id: str, dashboard: Dict[str, Any]):
+        """
+        Add a dashboard to the lookup indexes.
+        
+        Args:
+            dashboard_id (str): Dashboard ID
+            dashboard (Dict[str, Any]): Dashboard data
+        """
+        self._index_name(dashboard_id, dashboard)
+        self._index_url(dashboard_id, dashboard)
+        dashboard_lists = set(dashboard.get('lists', []))
+        if not dashboard_lists:
+            self._no_list_count += 1
+        self._index_lists(dashboard_id, dashboard_lists)
+        
+        self._search_blobs[dashboard_id] = self._build_search_blob(dashboard)
+    
+    def _unindex_dashboard(self, dashboard_id: str, dashboard: Dict[str, Any]):
+        """
+        Remove a dashboard from the lookup indexes.
+        
+        Args:
+            dashboard_id (str): Dashboard ID
+            dashboard (Dict[str, Any]): Dashboard data as currently indexed
+        """
+        self._unindex_name(dashboard_id)
+        self._unindex_url(dashboard_id, dashboard)
+        dashboard_lists = set(dashboard.get('lists', []))
+        if not dashboard_lists:
+            self._no_list_count -= 1
+        self._unindex_lists(dashboard_id, dashboard_lists)
+        
+        self._search_blobs.pop(dashboard_id, None)
+    
+    def _index_name(self, dashboard_id: str, dashboard: Dict[str, Any]):
+        """Register a dashboard's lowercased name in the name index."""
+        name_key = dashboard.get('name', '').lower()
+        self._name_keys[dashboard_id] = name_key
+        self._by_name_lower.setdefault(name_key, {})[dashboard_id] = None
+    
+    def _unindex_name(self, dashboard_id: str):
+        """Remove a dashboard's name from the name index."""
+        # Use the key computed at indexing time rather than lowercasing again
+        name_key = self._name_keys.pop(dashboard_id, None)
+        if name_key is not None:
+            self._discard_holder(self._by_name_lower, name_key, dashboard_id)
+    
+    def _index_url(self, dashboard_id: str, dashboard: Dict[str, Any]):
+        """Register a dashboard's URL in the URL index."""
+        self._by_url.setdefault(dashboard.get('url', ''), {})[dashboard_id] = None
+    
+    def _unindex_url(self, dashboard_id: str, dashboard: Dict[str, Any]):
+        """Remove a dashboard's URL, as currently indexed, from the URL index."""
+        self._discard_holder(self._by_url, dashboard.get('url', ''), dashboard_id)
+    
+    def _index_lists(self, dashboard_id: str, list_names: Iterable[str]):
+        """
+        Add a dashboard to the per-list index and usage counts.
+        
+        Args:
+            dashboard_id (str): Dashboard ID
+            list_names (Iterable[str]): Distinct lists the dashboard joins
+        """
+        for list_name in list_names:
+            self._by_list.setdefault(list_name, {})[dashboard_id] = None
+            self._list_refcount[list_name] += 1
+    
+    def _unindex_lists(self, dashboard_id: str, list_names: Iterable[str]):
+        """
+        Remove a dashboard from the per-list index and usage counts.
+        
+        Args:
+            dashboard_id (str): Dashboard ID
+            list_names (Iterable[str]): Distinct lists the dashboard leaves
+        """
+        for list_name in list_names:
+            self._discard_holder(self._by_list, list_name, dashboard_id)
+            
+            self._list_refcount[list_name] -= 1
+            if self._list_refcount[list_name] <= 0:
+                del self._list_refcount[list_name]
+    
+    @staticmethod
+    def _has_other_holder(index: Dict[str, Dict[str, None]], key: str, exclude_id: Optional[str]) -> bool:
+        """
+        Check whether a key is held by any dashboard other than exclude_id.
+        
+        Args:
+            index (Dict[str, Dict[str, None]]): Name, URL or list index
+            key (str): Key to look up
+            exclude_id (Optional[str]): Dashboard ID to ignore
+            
+        Returns:
+            bool: True if another dashboard holds the key
+        """
+        return any(holder_id != exclude_id for holder_id in index.get(key, ()))
+    
+    @staticmethod
+    def _discard_holder(index: Dict[str, Dict[str, None]], key: str, dashboard_id: str):
+        """
+        Remove a dashboard from a key's holders, dropping the key once none remain.
+        
+        Args:
+            index (Dict[str, Dict[str, None]]): Name, URL or list index
+            key (str): Key the dashboard was indexed under
+            dashboard_id (str): Dashboard ID
+        """
+        holder_ids = index.get(key)
+        if holder_ids is not None:
+            holder_ids.pop(dashboard_id, None)
+            if not holder_ids:
+                del index[key]
+    
+    @staticmethod
+    def _build_search_blob(dashboard: Dict[str, Any]) -> str:
+        """
+        Build the lowercased text searched by search_dashboards().
+        
+        Fields are joined with NUL characters so a query cannot match across
+        the boundary between two fields.
+        
+        Args:
+            dashboard (Dict[str, Any]): Dashboard data
+            
+        Returns:
+            str: Lowercased search text
+        """
+        return '\0'.join((
+            dashboard.get('name') or '',
+            dashboard.get('url') or '',
+            dashboard.get('description') or '',
+            *dashboard.get('lists', [])
+        )).lower()
+    
+    def _cleanup_unused_lists(self, list_names: Set[str]):
+        """
+        Remove lists that are no longer used by any dashboard.
+        
+        Args:
+            list_names (Set[str]): Lists whose usage may have dropped to zero
+        """
+        for list_name in list_names:
+            if list_name in self.lists and not self._list_refcount.get(list_name):
+                self.lists.remove(list_name)
+                logger.debug(f"Removed unused list: {list_name}")
     
     def update_dashboard_status(self, dashboard_id: str, status: str, 
                               last_captured: str = None) -> bool:
@@ -803,7 +1521,7 @@ class DashboardManager:
                 dashboard['last_captured'] = last_captured
                 dashboard['capture_count'] = dashboard.get('capture_count', 0) + 1
             
-            self.save_dashboards()
+            self._mark_dirty([dashboard_id])
             return True
             
         except Exception as e:
@@ -266,7 +266,7 @@ class ScheduleManager:
         """Save all schedules to the configuration file."""
         try:
             with open(Config.SCHEDULE_FILE, 'w') as f:
-                json.dump(self.schedules, f, indent=2, default=str)
+                f.write(json.dumps(self.schedules, indent=2, default=str))
             logger.debug("Schedules saved to file")
         except Exception as e:
             logger.error(f"Error saving schedules: {e}")